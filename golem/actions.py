@@ -1556,7 +1556,8 @@ def send_keys(element, text):
 
 
 def send_keys_with_delay(element, text, delay=0.1):
-    """Send keys to element one by one with a delay between keys.
+    """Send keys to element one by one, `delay` seconds apart.
+    When delay is 0 the whole text is sent at once.
     Delay must be a positive int or float.
 
     Parameters:
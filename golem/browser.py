@@ -1,5 +1,4 @@
 """Functions to interact with a webdriver browser object."""
-import traceback
 from contextlib import contextmanager
 
 from selenium import webdriver
@@ -69,44 +68,6 @@ def open_browser(browser_name=None, capabilities=None, remote_url=None, browser_
     :Returns:
       the opened browser
     """
-    @contextmanager
-    def validate_exec_path(browser_name, exec_path_setting, settings):
-        executable_path = settings[exec_path_setting]
-        if executable_path:
-            matched_executable_path = utils.match_latest_executable_path(executable_path,
-                                                                         execution.testdir)
-            if matched_executable_path:
-                try:
-                    yield matched_executable_path
-                except Exception:
-                    msg = (
-                        f"Could not start {browser_name} driver using ",
-                        f"the path '{executable_path}'\n",
-                        f"verify that the {exec_path_setting} setting points ",
-                        "to a valid webdriver executable.",
-                    )
-                    execution.logger.error(msg)
-                    execution.logger.info(traceback.format_exc())
-                    raise Exception(msg)
-            else:
-                msg = f'No executable file found using path {executable_path}'
-                execution.logger.error(msg)
-                raise Exception(msg)
-        else:
-            msg = f'{exec_path_setting} setting is not defined'
-            execution.logger.error(msg)
-            raise Exception(msg)
-
-    @contextmanager
-    def validate_remote_url(remote_url):
-        if remote_url:
-            yield remote_url
-        else:
-            msg = 'remote_url setting is required'
-            execution.logger.error(msg)
-            raise Exception(msg)
-
-    project = Project(execution.project_name)
     browser_definition = execution.browser_definition
     settings = execution.settings
     if browser_name is None:
@@ -116,104 +77,34 @@ def open_browser(browser_name=None, capabilities=None, remote_url=None, browser_
     if remote_url is None:
         remote_url = settings['remote_url']
     is_custom = False
+    already_maximized = False
 
     if not browser_id:
-        if len(execution.browsers) == 0:
-            browser_id = 'main'
-        else:
-            browser_id = f'browser{len(execution.browsers)}'
+        browser_id = _new_browser_id()
     if browser_id in execution.browsers:
         raise InvalidBrowserIdError(f"browser id '{browser_id}' is already in use")
 
+    browser_factory = _BROWSER_FACTORIES.get(browser_name)
     # remote
     if capabilities:
-        with validate_remote_url(remote_url) as remote_url:
-            driver = GolemRemoteDriver(command_executor=remote_url,
-                                       desired_capabilities=capabilities)
-    # Chrome
-    elif browser_name == 'chrome':
-        with validate_exec_path('chrome', 'chromedriver_path', settings) as ex_path:
-            chrome_options = webdriver.ChromeOptions()
-            if settings['start_maximized']:
-                chrome_options.add_argument('start-maximized')
-            service = ChromeService(executable_path=ex_path)
-            driver = GolemChromeDriver(service=service, options=chrome_options)
-    # Chrome headless
-    elif browser_name == 'chrome-headless':
-        with validate_exec_path('chrome', 'chromedriver_path', settings) as ex_path:
-            chrome_options = webdriver.ChromeOptions()
-            chrome_options.add_argument('headless')
-            chrome_options.add_argument('--window-size=1600,1600')
-            service = ChromeService(executable_path=ex_path)
-            driver = GolemChromeDriver(service=service, options=chrome_options)
-    # Chrome remote
-    elif browser_name == 'chrome-remote':
-        with validate_remote_url(remote_url) as remote_url:
-            driver = GolemRemoteDriver(command_executor=remote_url,
-                                       desired_capabilities=DesiredCapabilities.CHROME)
-    # Chrome remote headless
-    elif browser_name == 'chrome-remote-headless':
-        with validate_remote_url(remote_url) as remote_url:
-            chrome_options = webdriver.ChromeOptions()
-            chrome_options.add_argument('headless')
-            desired_capabilities = chrome_options.to_capabilities()
-            driver = GolemRemoteDriver(command_executor=remote_url,
-                                       desired_capabilities=desired_capabilities)
-    # Edge
-    elif browser_name == 'edge':
-        with validate_exec_path('edge', 'edgedriver_path', settings) as ex_path:
-            driver = GolemEdgeDriver(executable_path=ex_path)
-    # Edge remote
-    elif browser_name == 'edge-remote':
-        with validate_remote_url(remote_url) as remote_url:
-            driver = GolemRemoteDriver(command_executor=remote_url,
-                                       desired_capabilities=DesiredCapabilities.EDGE)
-    # Firefox
-    elif browser_name == 'firefox':
-        with validate_exec_path('firefox', 'geckodriver_path', settings) as ex_path:
-            driver = GolemGeckoDriver(executable_path=ex_path)
-    # Firefox headless
-    elif browser_name == 'firefox-headless':
-        with validate_exec_path('firefox', 'geckodriver_path', settings) as ex_path:
-            firefox_options = webdriver.FirefoxOptions()
-            firefox_options.headless = True
-            driver = GolemGeckoDriver(executable_path=ex_path, firefox_options=firefox_options)
-    # Firefox remote
-    elif browser_name == 'firefox-remote':
-        with validate_remote_url(remote_url) as remote_url:
-            driver = GolemRemoteDriver(command_executor=remote_url,
-                                       desired_capabilities=DesiredCapabilities.FIREFOX)
-    # Firefox remote headless
-    elif browser_name == 'firefox-remote-headless':
-        with validate_remote_url(remote_url) as remote_url:
-            firefox_options = webdriver.FirefoxOptions()
-            firefox_options.headless = True
-            desired_capabilities = firefox_options.to_capabilities()
-            driver = GolemRemoteDriver(command_executor=remote_url,
-                                       desired_capabilities=desired_capabilities)
-    # IE
-    elif browser_name == 'ie':
-        with validate_exec_path('internet explorer', 'iedriver_path', settings) as ex_path:
-            driver = GolemIeDriver(executable_path=ex_path)
-    # IE remote
-    elif browser_name == 'ie-remote':
-        with validate_remote_url(remote_url) as remote_url:
-            driver = GolemRemoteDriver(command_executor=remote_url,
-                                       desired_capabilities=DesiredCapabilities.INTERNETEXPLORER)
-    # Opera remote
-    elif browser_name == 'opera-remote':
-        with validate_remote_url(remote_url) as remote_url:
-            driver = GolemRemoteDriver(command_executor=remote_url,
-                                       desired_capabilities=DesiredCapabilities.OPERA)
-    elif browser_name in project.custom_browsers():
-        is_custom = True
-        module, _ = project.custom_browser_module()
-        custom_browser_func = getattr(module, browser_name)
-        driver = custom_browser_func(settings)
+        with _validate_remote_url(remote_url) as remote_url:
+            driver = _start_remote_driver(remote_url, capabilities, settings)
+    elif browser_factory is not None:
+        driver = browser_factory(settings, remote_url)
+        # local chrome is started with the start-maximized argument
+        already_maximized = browser_factory is _start_chrome
     else:
-        raise Exception(f"Error: {browser_definition['name']} is not a valid driver")
+        # custom browsers are only looked up when the name is not a built-in browser
+        project = Project(execution.project_name)
+        if browser_name in project.custom_browsers():
+            is_custom = True
+            module, _ = project.custom_browser_module()
+            custom_browser_func = getattr(module, browser_name)
+            driver = custom_browser_func(settings)
+        else:
+            raise Exception(f"Error: {browser_definition['name']} is not a valid driver")
 
-    if settings['start_maximized'] and not is_custom:
+    if settings['start_maximized'] and not is_custom and not already_maximized:
         # currently there is no way to maximize chrome window on OSX (chromedriver 2.43),
         # adding workaround
         # https://bugs.chromium.org/p/chromedriver/issues/detail?id=2389
@@ -223,19 +114,326 @@ def open_browser(browser_name=None, capabilities=None, remote_url=None, browser_
         if not ('chrome' in browser_definition['name'] and is_mac):
             driver.maximize_window()
 
+    _add_browser(browser_id, driver)
+    return execution.browser
+
+
+def _new_browser_id():
+    # ids are based on the amount of browsers opened by the test so
+    # they are not reused after a browser is closed
+    if execution._browsers_opened == 0:
+        return 'main'
+    return f'browser{execution._browsers_opened}'
+
+
+def _add_browser(browser_id, driver):
+    """Add driver to the test browsers and set it as the active browser"""
+    max_open_browsers = execution.settings['max_open_browsers']
+    while max_open_browsers and len(execution.browsers) >= max_open_browsers:
+        _close_oldest_browser()
+
     execution.browsers[browser_id] = driver
-    # Set the new browser as the active browser
+    execution._browsers_opened += 1
     execution.browser = driver
-    return execution.browser
+
+
+def _close_oldest_browser():
+    """Quit the first opened browser that is still open"""
+    browser_id = next(iter(execution.browsers))
+    driver = execution.browsers.pop(browser_id)
+    execution.logger.warning(f"Closing browser '{browser_id}', max_open_browsers "
+                             f"({execution.settings['max_open_browsers']}) reached")
+    try:
+        driver.quit()
+    except Exception:
+        execution.logger.error('there was an error closing the driver', exc_info=True)
+
+
+# matched webdriver executables by (executable_path setting, testdir)
+_executable_path_cache = {}
+
+
+def _match_executable_path(executable_path, testdir):
+    """Cached utils.match_latest_executable_path.
+    Only found executables are cached so a missing driver is
+    looked up again the next time a browser is opened.
+    """
+    key = (executable_path, testdir)
+    if key not in _executable_path_cache:
+        matched_executable_path = utils.match_latest_executable_path(executable_path, testdir)
+        if matched_executable_path is None:
+            return None
+        _executable_path_cache[key] = matched_executable_path
+    return _executable_path_cache[key]
+
+
+def resolve_executable_paths(settings, testdir):
+    """Match the webdriver executables defined in settings.
+    Called by the execution runner before running the tests so
+    the lookup is done once instead of on every browser start
+    (processes forked afterwards inherit the matched paths).
+    """
+    for exec_path_setting in ('chromedriver_path', 'edgedriver_path',
+                              'geckodriver_path', 'iedriver_path'):
+        executable_path = settings.get(exec_path_setting)
+        if executable_path:
+            _match_executable_path(executable_path, testdir)
+
+
+@contextmanager
+def _validate_exec_path(browser_name, exec_path_setting, settings):
+    executable_path = settings[exec_path_setting]
+    if executable_path:
+        matched_executable_path = _match_executable_path(executable_path, execution.testdir)
+        if matched_executable_path:
+            try:
+                yield matched_executable_path
+            except Exception:
+                msg = (
+                    f"Could not start {browser_name} driver using "
+                    f"the path '{executable_path}'\n"
+                    f"verify that the {exec_path_setting} setting points "
+                    "to a valid webdriver executable."
+                )
+                execution.logger.exception(msg)
+                raise Exception(msg)
+        else:
+            msg = f'No executable file found using path {executable_path}'
+            execution.logger.error(msg)
+            raise Exception(msg)
+    else:
+        msg = f'{exec_path_setting} setting is not defined'
+        execution.logger.error(msg)
+        raise Exception(msg)
+
+
+@contextmanager
+def _validate_remote_url(remote_url):
+    if remote_url:
+        yield remote_url
+    else:
+        msg = 'remote_url setting is required'
+        execution.logger.error(msg)
+        raise Exception(msg)
+
+
+def _start_remote_driver(remote_url, desired_capabilities, settings):
+    driver = GolemRemoteDriver(command_executor=remote_url,
+                               desired_capabilities=desired_capabilities)
+    _set_connection_pool_size(driver, settings['webdriver_pool_size'])
+    return driver
+
+
+def _set_connection_pool_size(driver, pool_size):
+    """Set the max amount of connections kept to the remote webdriver.
+    The urllib3 pool manager used by Selenium keeps one connection
+    per host by default, concurrent commands then discard and
+    re-create connections.
+    """
+    connection_manager = getattr(driver.command_executor, '_conn', None)
+    if connection_manager is None or not pool_size:
+        return
+    connection_manager.connection_pool_kw['maxsize'] = pool_size
+    # the pool created for the new session request has the default size,
+    # it's replaced by a new pool on the next command
+    connection_manager.clear()
+
+
+# Snapshots of the Selenium DesiredCapabilities, copied before each use
+# since the driver may modify the capabilities it receives
+_CHROME_CAPS = dict(DesiredCapabilities.CHROME)
+_EDGE_CAPS = dict(DesiredCapabilities.EDGE)
+_FIREFOX_CAPS = dict(DesiredCapabilities.FIREFOX)
+_IE_CAPS = dict(DesiredCapabilities.INTERNETEXPLORER)
+
+
+def _make_headless_chrome_options():
+    """Return new ChromeOptions with the headless argument.
+    A new instance is required each time as options are mutable.
+    """
+    chrome_options = webdriver.ChromeOptions()
+    chrome_options.add_argument('headless')
+    return chrome_options
+
+
+def _make_headless_firefox_options():
+    """Return new headless FirefoxOptions"""
+    firefox_options = webdriver.FirefoxOptions()
+    firefox_options.headless = True
+    return firefox_options
+
+
+def _start_chrome(settings, remote_url):
+    with _validate_exec_path('chrome', 'chromedriver_path', settings) as ex_path:
+        chrome_options = webdriver.ChromeOptions()
+        if settings['start_maximized']:
+            chrome_options.add_argument('start-maximized')
+        service = ChromeService(executable_path=ex_path)
+        return GolemChromeDriver(service=service, options=chrome_options)
+
+
+def _start_chrome_headless(settings, remote_url):
+    with _validate_exec_path('chrome', 'chromedriver_path', settings) as ex_path:
+        chrome_options = _make_headless_chrome_options()
+        chrome_options.add_argument('--window-size=1600,1600')
+        service = ChromeService(executable_path=ex_path)
+        return GolemChromeDriver(service=service, options=chrome_options)
+
+
+def _start_chrome_remote(settings, remote_url):
+    with _validate_remote_url(remote_url) as remote_url:
+        return _start_remote_driver(remote_url, _CHROME_CAPS.copy(), settings)
+
+
+def _start_chrome_remote_headless(settings, remote_url):
+    with _validate_remote_url(remote_url) as remote_url:
+        desired_capabilities = _make_headless_chrome_options().to_capabilities()
+        return _start_remote_driver(remote_url, desired_capabilities, settings)
+
+
+def _start_edge(settings, remote_url):
+    with _validate_exec_path('edge', 'edgedriver_path', settings) as ex_path:
+        return GolemEdgeDriver(executable_path=ex_path)
+
+
+def _start_edge_remote(settings, remote_url):
+    with _validate_remote_url(remote_url) as remote_url:
+        return _start_remote_driver(remote_url, _EDGE_CAPS.copy(), settings)
+
+
+def _start_firefox(settings, remote_url):
+    with _validate_exec_path('firefox', 'geckodriver_path', settings) as ex_path:
+        return GolemGeckoDriver(executable_path=ex_path)
+
+
+def _start_firefox_headless(settings, remote_url):
+    with _validate_exec_path('firefox', 'geckodriver_path', settings) as ex_path:
+        firefox_options = _make_headless_firefox_options()
+        return GolemGeckoDriver(executable_path=ex_path, firefox_options=firefox_options)
+
+
+def _start_firefox_remote(settings, remote_url):
+    with _validate_remote_url(remote_url) as remote_url:
+        return _start_remote_driver(remote_url, _FIREFOX_CAPS.copy(), settings)
+
+
+def _start_firefox_remote_headless(settings, remote_url):
+    with _validate_remote_url(remote_url) as remote_url:
+        firefox_options = _make_headless_firefox_options()
+        desired_capabilities = firefox_options.to_capabilities()
+        return _start_remote_driver(remote_url, desired_capabilities, settings)
+
+
+def _start_ie(settings, remote_url):
+    with _validate_exec_path('internet explorer', 'iedriver_path', settings) as ex_path:
+        return GolemIeDriver(executable_path=ex_path)
+
+
+def _start_ie_remote(settings, remote_url):
+    with _validate_remote_url(remote_url) as remote_url:
+        return _start_remote_driver(remote_url, _IE_CAPS.copy(), settings)
+
+
+def _start_opera_remote(settings, remote_url):
+    # OPERA is not defined in newer Selenium versions, it is not read at import
+    with _validate_remote_url(remote_url) as remote_url:
+        return _start_remote_driver(remote_url, dict(DesiredCapabilities.OPERA), settings)
+
+
+_BROWSER_FACTORIES = {
+    'chrome': _start_chrome,
+    'chrome-headless': _start_chrome_headless,
+    'chrome-remote': _start_chrome_remote,
+    'chrome-remote-headless': _start_chrome_remote_headless,
+    'edge': _start_edge,
+    'edge-remote': _start_edge_remote,
+    'firefox': _start_firefox,
+    'firefox-headless': _start_firefox_headless,
+    'firefox-remote': _start_firefox_remote,
+    'firefox-remote-headless': _start_firefox_remote_headless,
+    'ie': _start_ie,
+    'ie-remote': _start_ie_remote,
+    'opera-remote': _start_opera_remote,
+}
 
 
 def get_browser() -> GolemRemoteDriver:
-    """Returns the active browser. Starts a new one if there is none."""
+    """Returns the active browser. Starts a new one if there is none.
+
+    When the `reuse_browser_session` setting is true the browser
+    left open by a previous test is used instead, after clearing
+    its cookies and storage.
+    """
     if not execution.browser:
-        open_browser()
+        if execution.settings['reuse_browser_session']:
+            _open_reused_browser()
+        else:
+            open_browser()
     return execution.browser
 
 
+# browser kept open between tests when reuse_browser_session is true
+# and the browser definition it was opened with
+_reused_driver = None
+_reused_browser_definition = None
+
+
+def _open_reused_browser():
+    global _reused_driver, _reused_browser_definition
+    same_browser = _reused_browser_definition == execution.browser_definition
+    if (_reused_driver is not None and same_browser
+            and _reset_browser_session(_reused_driver)):
+        _add_browser(_new_browser_id(), _reused_driver)
+    else:
+        # the previous browser can't be used by this test
+        quit_reused_browser()
+        _reused_driver = open_browser()
+        _reused_browser_definition = execution.browser_definition
+
+
+def _reset_browser_session(driver):
+    """Close the extra windows and clear the cookies and storage of a
+    browser used by a previous test.
+    Returns False when the browser is no longer usable.
+    """
+    try:
+        first_window, *other_windows = driver.window_handles
+        for window in other_windows:
+            driver.switch_to.window(window)
+            driver.close()
+        driver.switch_to.window(first_window)
+        driver.switch_to.default_content()
+        if hasattr(driver, 'execute_cdp_cmd'):
+            # clear the cookies of every domain, not only the current one
+            driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+        else:
+            driver.delete_all_cookies()
+        driver.execute_script('try { window.localStorage.clear(); '
+                              'window.sessionStorage.clear(); } catch (e) {}')
+        driver.get('about:blank')
+        driver._selector_cache = {}
+        return True
+    except Exception:
+        return False
+
+
+def is_reused_browser(driver):
+    """Returns whether driver is kept open to be used by the next test"""
+    return driver is not None and driver is _reused_driver
+
+
+def quit_reused_browser():
+    """Quit the browser kept open by the reuse_browser_session setting"""
+    global _reused_driver, _reused_browser_definition
+    if _reused_driver is not None:
+        try:
+            _reused_driver.quit()
+        except Exception:
+            pass
+        _reused_driver = None
+        _reused_browser_definition = None
+
+
 def activate_browser(browser_id):
     """Activate a browser.
     Only needed when the test starts more than one browser instance.
@@ -75,6 +75,8 @@ REDUCED_SETTINGS_FILE_CONTENT = (
 
 DEFAULTS = [
     ('search_timeout', 0),
+    ('search_poll_frequency', 0.2),
+    ('selector_cache_ttl', 0),
     ('wait_displayed', False),
     ('screenshot_on_error', True),
     ('screenshot_on_step', False),
@@ -94,6 +96,9 @@ DEFAULTS = [
     ('cli_log_level', 'INFO'),
     ('log_all_events', True),
     ('start_maximized', True),
+    ('max_open_browsers', 0),
+    ('webdriver_pool_size', 10),
+    ('reuse_browser_session', False),
     ('screenshots', {})
 ]
 
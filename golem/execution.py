@@ -4,6 +4,7 @@ test_file = None
 browser = None
 browser_definition = None
 browsers = {}
+_browsers_opened = 0
 data = None
 secrets = None
 description = None
@@ -6,6 +6,7 @@ import traceback
 import uuid
 from types import SimpleNamespace
 
+from golem.browser import quit_reused_browser, resolve_executable_paths
 from golem.core import session
 from golem.core import utils
 from golem.core import test_data
@@ -413,16 +414,22 @@ class ExecutionRunner:
                 print(traceback.format_exc())
 
         if not suite_error:
+            resolve_executable_paths(session.settings, session.testdir)
+
             if self.interactive and self.execution.processes != 1:
                 print('WARNING: to run in debug mode, processes must equal one')
 
             if self.execution.processes == 1:
                 # run tests serially
-                for test in self.execution.tests:
-                    run_test(session.testdir, self.project.name, test.name, test.data_set, test.secrets,
-                             test.browser, test.env, session.settings, test.reportdir, test.set_name,
-                             self.test_functions, self.execution.has_failed_tests,
-                             self.execution.tags, self.is_suite)
+                try:
+                    for test in self.execution.tests:
+                        run_test(session.testdir, self.project.name, test.name,
+                                 test.data_set, test.secrets, test.browser, test.env,
+                                 session.settings, test.reportdir, test.set_name,
+                                 self.test_functions, self.execution.has_failed_tests,
+                                 self.execution.tags, self.is_suite)
+                finally:
+                    quit_reused_browser()
             else:
                 # run tests using multiprocessing
                 multiprocess_executor(self.project.name, self.execution.tests,
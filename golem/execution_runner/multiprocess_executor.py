@@ -4,6 +4,7 @@ provided in parallel using multiprocessing.
 from multiprocessing import Pool
 from multiprocessing.pool import ApplyResult
 
+from golem.browser import quit_reused_browser
 from golem.core import session
 from golem.test_runner.test_runner import run_test
 
@@ -28,8 +29,18 @@ def multiprocess_executor(project, execution_list, has_failed_tests, test_functi
                 has_failed_tests,
                 tags,
                 is_suite)
-        apply_async = pool.apply_async(run_test, args=args)
+        apply_async = pool.apply_async(_run_test, args=args)
         results.append(apply_async)
     map(ApplyResult.wait, results)
     pool.close()
     pool.join()
+
+
+def _run_test(*args):
+    """Run a test in a pool process.
+    Each process runs a single test so a reused browser is quit after it.
+    """
+    try:
+        run_test(*args)
+    finally:
+        quit_reused_browser()
@@ -12,6 +12,7 @@ from golem.test_runner.test_runner_utils import import_page_into_test
 from golem.test_runner import test_logger
 from golem.test_runner.conf import ResultsEnum
 from golem import actions, execution
+from golem.browser import is_reused_browser
 from golem.report import test_report
 
 
@@ -337,8 +338,10 @@ class TestRunner:
         # let's try to close the driver manually
         if execution.browser:
             try:
-                for browser, driver in execution.browsers.items():
-                    driver.quit()
+                for driver in execution.browsers.values():
+                    # a reused browser is quit when the execution ends
+                    if not is_reused_browser(driver):
+                        driver.quit()
             except:
                 # if this fails, we have lost control over the webdriver window
                 # and we are not going to be able to close it
@@ -396,6 +399,7 @@ class TestRunner:
         execution.browser = None
         execution.browser_definition = self.browser
         execution.browsers = {}
+        execution._browsers_opened = 0
         execution.data = Data(self.test_data)
         execution.secrets = Secrets(self.secrets)
         execution.description = None
@@ -1,4 +1,5 @@
-from typing import List
+from typing import List, Optional
+import re
 import time
 
 from selenium.webdriver.remote.webelement import WebElement as RemoteWebElement
@@ -8,6 +9,7 @@ from selenium.webdriver.support.select import Select as SeleniumSelect
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
 
 from golem import execution
 from golem.webdriver import golem_expected_conditions as gec
@@ -16,6 +18,69 @@ from golem.core.exceptions import (IncorrectSelectorType,
                                    ElementNotDisplayed)
 
 
+_SELECTOR_MAP = {
+    'id': By.ID,
+    'css': By.CSS_SELECTOR,
+    'link_text': By.LINK_TEXT,
+    'partial_link_text': By.PARTIAL_LINK_TEXT,
+    'name': By.NAME,
+    'xpath': By.XPATH,
+    'tag_name': By.TAG_NAME,
+}
+
+# Keyword search criteria, in order of precedence
+_SELECTOR_KWARGS = ('id', 'name', 'link_text', 'partial_link_text', 'css', 'xpath', 'tag_name')
+
+# A string selector starting with any of these is treated as XPath
+_XPATH_PREFIXES = ('/', './', '(', '../', '..', '*/')
+
+# Maximum number of elements kept by the selector_cache_ttl cache
+# of a driver or element
+_SELECTOR_CACHE_MAX_SIZE = 100
+
+# Key names accepted by press_key
+_KEYS_MAP = {name: getattr(Keys, name) for name in dir(Keys) if not name.startswith('_')}
+
+_KEYS_NAMES = ','.join(_KEYS_MAP)
+
+
+def _get_by(selector_type):
+    """Return the selenium `By` strategy for a Golem selector type"""
+    by = _SELECTOR_MAP.get(selector_type)
+    if by is None:
+        raise IncorrectSelectorType(f'Selector {selector_type} is not a valid option')
+    return by
+
+
+class _ElementLocated:
+    """Wait condition for the first element that matches `locator`,
+    and that is displayed when `displayed` is True.
+
+    Elements are searched with find_elements so a missing element
+    does not raise an exception on every attempt.
+    `present` tells whether the element was found on the last attempt.
+    """
+    def __init__(self, locator, displayed):
+        self.locator = locator
+        self.displayed = displayed
+        self.present = False
+
+    def __call__(self, driver):
+        webelements = driver.find_elements(*self.locator)
+        self.present = bool(webelements)
+        if not webelements:
+            return False
+        webelement = webelements[0]
+        if self.displayed:
+            try:
+                if not webelement.is_displayed():
+                    return False
+            except StaleElementReferenceException:
+                self.present = False
+                return False
+        return webelement
+
+
 class Finder:
     def find(self, element=None, id=None, name=None, link_text=None,
              partial_link_text=None, css=None, xpath=None, tag_name=None,
@@ -84,111 +149,135 @@ class Finder:
             element, id, name, link_text, partial_link_text, css, xpath, tag_name
         )
 
+    def find_all_attribute(self, element, attribute) -> List[Optional[str]]:
+        """Get an attribute of all the elements that match a selector
+        in a single round-trip.
+
+        `element` can be an element tuple, a CSS string, or an XPath string.
+        Attributes are read with the DOM getAttribute method,
+        a missing attribute is None.
+
+        :Usage:
+            driver.find_all_attribute('ul#menu > li > a', 'href')
+            element.find_all_attribute(('xpath', './/input'), 'name')
+
+        :Returns:
+            a list of attribute values
+        """
+        selector_type, selector_value, _ = self._get_selector_data(element)
+        by = _get_by(selector_type)
+        if isinstance(self, ExtendedWebElement):
+            driver, context = self.parent, self
+        else:
+            driver, context = self, None
+        if by in (By.LINK_TEXT, By.PARTIAL_LINK_TEXT):
+            # link text selectors have no DOM equivalent, find the elements
+            # first and read the attribute of all of them in one script
+            webelements = self.find_elements(by, selector_value)
+            if not webelements:
+                return []
+            return driver.execute_script(ELEMENTS_ATTRIBUTE_SCRIPT, webelements, attribute)
+        return driver.execute_script(FIND_ALL_ATTRIBUTE_SCRIPT, selector_type,
+                                     selector_value, context, attribute)
+
     def _find_webelement(
         self, selector_type, selector_value, element_name,
         timeout=0, wait_displayed=False, highlight=False
     ):
         """Finds a web element."""
-        webelement = None
-
-        def remaining_time():
-            return timeout - (time.time() - start_time)
-
-        start_time = time.time()
-        while webelement is None:
-            try:
-                webelement = self._get_element(selector_type, selector_value)
-            except Exception:
-                if remaining_time() <= 0:
-                    break
-                else:
-                    time.sleep(0.5)
-                    execution.logger.debug(
-                        'Element not found yet, remaining time: {:.2f}'.format(remaining_time())
-                    )
-        if webelement is None:
+        locator = (_get_by(selector_type), selector_value)
+
+        # single attempts are used to check for presence, they always
+        # search the page to not report removed elements as present
+        cache_ttl = execution.settings['selector_cache_ttl'] if timeout > 0 else 0
+        cache_key = (selector_type, selector_value, wait_displayed)
+        if cache_ttl:
+            webelement = self._get_cached_webelement(cache_key, cache_ttl)
+            if webelement is not None:
+                return webelement
+
+        condition = _ElementLocated(locator, wait_displayed)
+        try:
+            if timeout > 0:
+                poll_frequency = execution.settings['search_poll_frequency']
+                wait = WebDriverWait(self, timeout, poll_frequency=poll_frequency)
+                webelement = wait.until(condition)
+            else:
+                # a single attempt without waiting
+                webelement = condition(self)
+        except TimeoutException:
+            webelement = None
+
+        if webelement:
+            if cache_ttl:
+                self._cache_webelement(cache_key, webelement, cache_ttl)
+            return webelement
+        elif condition.present:
+            msg = (
+                f'Timeout waiting for element {element_name} to be displayed, '
+                f'using selector {selector_type}:\'{selector_value}\''
+            )
+            raise ElementNotDisplayed(msg)
+        else:
             raise ElementNotFound(
                 f'Element {element_name} not found using selector '
                 f'{selector_type}:\'{selector_value}\''
             )
-        else:
-            if wait_displayed:
-                while not webelement.is_displayed() and remaining_time() > 0:
-                    execution.logger.debug('Element still not visible, waiting')
-                    time.sleep(0.5)
-
-                if not webelement.is_displayed():
-                    msg = (
-                        f'Timeout waiting for element {element_name} to be displayed, '
-                        f'using selector {selector_type}:\'{selector_value}\''
-                    )
-                    raise ElementNotDisplayed(msg)
-            return webelement
 
-    def _get_element(self, selector_type, selector_value, many=False):
-        func = self.find_elements if many else self.find_element
-        if selector_type == 'id':
-            return func(By.ID, selector_value)
-        elif selector_type == 'css':
-            return func(By.CSS_SELECTOR, selector_value)
-        elif selector_type == 'link_text':
-            return func(By.LINK_TEXT, selector_value)
-        elif selector_type == 'partial_link_text':
-            return func(By.PARTIAL_LINK_TEXT, selector_value)
-        elif selector_type == 'name':
-            return func(By.NAME, selector_value)
-        elif selector_type == 'xpath':
-            return func(By.XPATH, selector_value)
-        elif selector_type == 'tag_name':
-            return func(By.TAG_NAME, selector_value)
-        else:
-            msg = f'Selector {selector_type} is not a valid option'
-            raise IncorrectSelectorType(msg)
-        execution.logger.debug('Element found')
+    def _get_cached_webelement(self, cache_key, ttl):
+        """Return the webelement cached for `cache_key` if it was found
+        less than `ttl` seconds ago, None otherwise.
+        """
+        cache = getattr(self, '_selector_cache', None)
+        if cache and cache_key in cache:
+            webelement, found_at = cache[cache_key]
+            if time.monotonic() - found_at < ttl:
+                wait_displayed = cache_key[2]
+                try:
+                    if not wait_displayed or webelement.is_displayed():
+                        return webelement
+                except StaleElementReferenceException:
+                    pass
+            cache.pop(cache_key, None)
+        return None
+
+    def _cache_webelement(self, cache_key, webelement, ttl):
+        """Cache a webelement found with `cache_key`.
+        Expired entries are removed and the cache never holds more
+        than _SELECTOR_CACHE_MAX_SIZE entries.
+        """
+        cache = getattr(self, '_selector_cache', None)
+        if cache is None:
+            cache = self._selector_cache = {}
+        now = time.monotonic()
+        for key in [k for k, (_, found_at) in cache.items() if now - found_at >= ttl]:
+            del cache[key]
+        cache.pop(cache_key, None)
+        while len(cache) >= _SELECTOR_CACHE_MAX_SIZE:
+            # entries are kept in insertion order, drop the oldest one
+            del cache[next(iter(cache))]
+        cache[cache_key] = (webelement, now)
+        webelement._cached_in = cache
 
     def _get_selector_data(
         self, element=None, id=None, name=None, link_text=None, partial_link_text=None,
         css=None, xpath=None, tag_name=None
     ):
-        selector_type = None
-        selector_value = None
-        element_name = None
-
-        if isinstance(element, tuple):
-            selector_type = element[0]
-            selector_value = element[1]
-            element_name = element[2] if len(element) == 3 else element[1]
-        elif isinstance(element, str):
+        if isinstance(element, str):
             if self._str_is_xpath_selector(element):
                 selector_type = 'xpath'
-                selector_value = element
-                element_name = element
             else:
                 selector_type = 'css'
-                selector_value = element
-                element_name = element
-        elif id:
-            selector_type = 'id'
-            selector_value = element_name = id
-        elif name:
-            selector_type = 'name'
-            selector_value = element_name = name
-        elif link_text:
-            selector_type = 'link_text'
-            selector_value = element_name = link_text
-        elif partial_link_text:
-            selector_type = 'partial_link_text'
-            selector_value = element_name = partial_link_text
-        elif css:
-            selector_type = 'css'
-            selector_value = element_name = css
-        elif xpath:
-            selector_type = 'xpath'
-            selector_value = element_name = xpath
-        elif tag_name:
-            selector_type = 'tag_name'
-            selector_value = element_name = tag_name
+            selector_value = element_name = element
+        elif isinstance(element, tuple):
+            selector_type = element[0]
+            selector_value = element[1]
+            element_name = element[2] if len(element) == 3 else element[1]
         else:
+            values = (id, name, link_text, partial_link_text, css, xpath, tag_name)
+            for selector_type, selector_value in zip(_SELECTOR_KWARGS, values):
+                if selector_value:
+                    return (selector_type, selector_value, selector_value,)
             raise IncorrectSelectorType('Selector is not a valid option')
         return (selector_type, selector_value, element_name,)
 
@@ -204,17 +293,22 @@ class Finder:
         a css selector string
         an XPath selector string
         """
+        settings = execution.settings
         if timeout is None:
-            timeout = execution.settings['search_timeout']
+            timeout = settings['search_timeout']
 
         if wait_displayed is None:
-            wait_displayed = execution.settings['wait_displayed']
+            wait_displayed = settings['wait_displayed']
 
         if highlight is None:
-            highlight = execution.settings['highlight_elements']
+            highlight = settings['highlight_elements']
+
+        # an element that is already extended is returned as is
+        if isinstance(element, ExtendedWebElement) and not highlight:
+            return element
 
         webelement = None
-        if isinstance(element, RemoteWebElement) or isinstance(element, ExtendedWebElement):
+        if isinstance(element, (RemoteWebElement, ExtendedWebElement)):
             webelement = element
 
         if not webelement:
@@ -224,11 +318,11 @@ class Finder:
             webelement = self._find_webelement(
                 selector_type, selector_value, element_name, timeout, wait_displayed, highlight
             )
-            webelement.selector_type = selector_type
-            webelement.selector_value = selector_value
-            webelement.name = element_name
-
-        webelement = extend_webelement(webelement)
+            webelement = _extend_found_webelement(
+                webelement, selector_type, selector_value, element_name
+            )
+        else:
+            webelement = extend_webelement(webelement)
         # highlight element
         if highlight:
             webelement.highlight()
@@ -249,23 +343,14 @@ class Finder:
         selector_type, selector_value, element_name = self._get_selector_data(
             element, id, name, link_text, partial_link_text, css, xpath, tag_name
         )
-        webelements = self._get_element(selector_type, selector_value, many=True)
-
-        extended_webelements = []
-        for elem in webelements:
-            elem.selector_type = selector_type
-            elem.selector_value = selector_value
-            elem.name = element_name
-            extended_webelements.append(extend_webelement(elem))
+        webelements = self.find_elements(_get_by(selector_type), selector_value)
 
-        return extended_webelements
+        return [_extend_found_webelement(elem, selector_type, selector_value, element_name)
+                for elem in webelements]
 
-    def _str_is_xpath_selector(self, selector):
-        options = ['/', './', '(', '../', '..', '*/']
-        for option in options:
-            if selector.startswith(option):
-                return True
-        return False
+    @staticmethod
+    def _str_is_xpath_selector(selector):
+        return selector.startswith(_XPATH_PREFIXES)
 
 
 class ExtendedWebElement(Finder):
@@ -278,13 +363,11 @@ class ExtendedWebElement(Finder):
         """Check element if element is checkbox or radiobutton.
         If element is already checked, this is ignored.
         """
-        checkbox_or_radio = (self.tag_name == 'input' and
-                             self.get_attribute('type') in ['checkbox', 'radio'])
-        if checkbox_or_radio:
-            if not self.is_selected():
-                self.click()
-        else:
+        state = self.parent.execute_script(CHECKABLE_STATE_SCRIPT, self)
+        if state is None or state['type'] not in ('checkbox', 'radio'):
             raise ValueError(f'Element {self.name} is not checkbox or radiobutton')
+        if not state['checked']:
+            self.click()
 
     def double_click(self):
         """Double click the element"""
@@ -338,15 +421,13 @@ class ExtendedWebElement(Finder):
           element.press_key('TAB')
           element.press_key('LEFT')
         """
-        if hasattr(Keys, key):
-            key_attr = getattr(Keys, key)
-            self.send_keys(key_attr)
-        else:
-            defined_keys = [name for name in dir(Keys) if not name.startswith('_')]
+        key_attr = _KEYS_MAP.get(key)
+        if key_attr is None:
             error_msg = (f'Key {key} is invalid\n'
                          'valid keys are:\n'
-                         f'{",".join(defined_keys)}')
+                         f'{_KEYS_NAMES}')
             raise ValueError(error_msg)
+        self.send_keys(key_attr)
 
     @property
     def select(self):
@@ -354,11 +435,13 @@ class ExtendedWebElement(Finder):
         return Select(self)
 
     def send_keys_with_delay(self, value, delay=0.1):
-        """Send keys to element one by one with a delay between keys.
+        """Send keys to element one by one, `delay` seconds apart.
+        The time spent sending a key counts toward the delay.
+        When delay is 0 the whole value is sent at once.
 
         :Args:
          - value: a string to type
-         - delay: time between keys (in seconds)
+         - delay: time from one key to the next (in seconds)
 
         :Raises:
          - ValueError: if delay is not a positive int or float
@@ -367,38 +450,70 @@ class ExtendedWebElement(Finder):
             raise ValueError('delay must be int or float')
         elif delay < 0:
             raise ValueError('delay must be a positive number')
+        elif delay == 0:
+            self.send_keys(value)
         else:
             for c in value:
+                # the time spent sending the key is part of the delay
+                start = time.monotonic()
                 self.send_keys(c)
-                time.sleep(delay)
+                remaining = delay - (time.monotonic() - start)
+                if remaining > 0:
+                    time.sleep(remaining)
+
+    def snapshot(self, attributes=(), properties=()):
+        """Read several attributes and properties of the element
+        in a single round-trip.
+
+        Attributes are read with the DOM getAttribute method,
+        a missing attribute is None.
+
+        :Usage:
+          element.snapshot(['href', 'class'], ['value', 'checked'])
+
+        :Returns:
+          a dict with format {'attributes': {..}, 'properties': {..}}
+        """
+        return self.parent.execute_script(
+            SNAPSHOT_SCRIPT, self, list(attributes), list(properties))
 
     def uncheck(self):
         """Uncheck element if element is checkbox.
         If element is already unchecked, this is ignored.
         """
-        is_checkbox = (self.tag_name == 'input' and
-                       self.get_attribute('type') == 'checkbox')
-        if is_checkbox:
-            if self.is_selected():
-                self.click()
-        else:
+        state = self.parent.execute_script(CHECKABLE_STATE_SCRIPT, self)
+        if state is None or state['type'] != 'checkbox':
             raise ValueError(f'Element {self.name} is not checkbox')
+        if state['checked']:
+            self.click()
 
     @property
     def value(self):
         """The value attribute of element"""
         return self.get_attribute('value')
 
+    def _wait(self, condition, message, timeout, until=True):
+        """Wait until `condition` is true, or until it is false when
+        `until` is False.
+
+        :Returns:
+          The element
+        """
+        wait = WebDriverWait(self.parent, timeout)
+        if until:
+            wait.until(condition, message=message)
+        else:
+            wait.until_not(condition, message=message)
+        return self
+
     def wait_displayed(self, timeout=30):
         """Wait for element to be displayed
 
         :Returns:
           The element
         """
-        wait = WebDriverWait(self.parent, timeout)
         message = f'Timeout waiting for element {self.name} to be displayed'
-        wait.until(EC.visibility_of(self), message=message)
-        return self
+        return self._wait(EC.visibility_of(self), message, timeout)
 
     def wait_enabled(self, timeout=30):
         """Wait for element to be enabled
@@ -406,10 +521,8 @@ class ExtendedWebElement(Finder):
         :Returns:
           The element
         """
-        wait = WebDriverWait(self.parent, timeout)
         message = f'Timeout waiting for element {self.name} to be enabled'
-        wait.until(gec.element_to_be_enabled(self), message=message)
-        return self
+        return self._wait(gec.element_to_be_enabled(self), message, timeout)
 
     def wait_has_attribute(self, attribute, timeout=30):
         """Wait for element to have attribute
@@ -417,10 +530,8 @@ class ExtendedWebElement(Finder):
         :Returns:
           The element
         """
-        wait = WebDriverWait(self.parent, timeout)
         message = f'Timeout waiting for element {self.name} to have attribute {attribute}'
-        wait.until(gec.element_to_have_attribute(self, attribute), message=message)
-        return self
+        return self._wait(gec.element_to_have_attribute(self, attribute), message, timeout)
 
     def wait_has_not_attribute(self, attribute, timeout=30):
         """Wait for element to not have attribute
@@ -428,11 +539,9 @@ class ExtendedWebElement(Finder):
         :Returns:
           The element
         """
-        wait = WebDriverWait(self.parent, timeout)
         message = f'Timeout waiting for element {self.name} to not have attribute {attribute}'
-        wait.until_not(gec.element_to_have_attribute(self, attribute),
-                       message=message)
-        return self
+        return self._wait(gec.element_to_have_attribute(self, attribute), message, timeout,
+                          until=False)
 
     def wait_not_displayed(self, timeout=30):
         """Wait for element to be not displayed
@@ -440,10 +549,8 @@ class ExtendedWebElement(Finder):
         :Returns:
           The element
         """
-        wait = WebDriverWait(self.parent, timeout)
         message = f'Timeout waiting for element {self.name} to be not displayed'
-        wait.until_not(EC.visibility_of(self), message=message)
-        return self
+        return self._wait(EC.visibility_of(self), message, timeout, until=False)
 
     def wait_not_enabled(self, timeout=30):
         """Wait for element to be not enabled
@@ -451,10 +558,8 @@ class ExtendedWebElement(Finder):
         :Returns:
           The element
         """
-        wait = WebDriverWait(self.parent, timeout)
         message = f'Timeout waiting for element {self.name} to be not enabled'
-        wait.until_not(gec.element_to_be_enabled(self), message=message)
-        return self
+        return self._wait(gec.element_to_be_enabled(self), message, timeout, until=False)
 
     def wait_text(self, text, timeout=30):
         """Wait for element text to match given text
@@ -462,10 +567,8 @@ class ExtendedWebElement(Finder):
         :Returns:
           The element
         """
-        wait = WebDriverWait(self.parent, timeout)
         message = f"Timeout waiting for element {self.name} text to be '{text}'"
-        wait.until(gec.element_text_to_be(self, text), message=message)
-        return self
+        return self._wait(gec.element_text_to_be(self, text), message, timeout)
 
     def wait_text_contains(self, text, timeout=30):
         """Wait for element to contain given text
@@ -473,10 +576,8 @@ class ExtendedWebElement(Finder):
         :Returns:
           The element
         """
-        wait = WebDriverWait(self.parent, timeout)
         message = f"Timeout waiting for element {self.name} text to contain '{text}'"
-        wait.until(gec.element_text_to_contain(self, text), message=message)
-        return self
+        return self._wait(gec.element_text_to_contain(self, text), message, timeout)
 
     def wait_text_is_not(self, text, timeout=30):
         """Wait fo element text to not match given text
@@ -484,10 +585,8 @@ class ExtendedWebElement(Finder):
         :Returns:
           The element
         """
-        wait = WebDriverWait(self.parent, timeout)
         message = f"Timeout waiting for element {self.name} text not to be '{text}'"
-        wait.until_not(gec.element_text_to_be(self, text), message=message)
-        return self
+        return self._wait(gec.element_text_to_be(self, text), message, timeout, until=False)
 
     def wait_text_not_contains(self, text, timeout=30):
         """Wait for element text to not contain text
@@ -495,11 +594,8 @@ class ExtendedWebElement(Finder):
         :Returns:
           The element
         """
-        wait = WebDriverWait(self.parent, timeout)
         message = f"Timeout waiting for element {self.name} text to not contain '{text}'"
-        wait.until_not(gec.element_text_to_contain(self, text),
-                       message=message)
-        return self
+        return self._wait(gec.element_text_to_contain(self, text), message, timeout, until=False)
 
 
 class Select(SeleniumSelect):
@@ -513,16 +609,79 @@ class Select(SeleniumSelect):
 
 
 class ExtendedRemoteWebElement(RemoteWebElement, ExtendedWebElement):
-    pass
+
+    def _execute(self, command, params=None):
+        try:
+            return super()._execute(command, params)
+        except StaleElementReferenceException:
+            _evict_cached_webelement(self)
+            raise
+
+
+def _evict_cached_webelement(webelement):
+    """Remove a stale webelement from the selector cache it was stored in"""
+    cache = getattr(webelement, '_cached_in', None)
+    if cache:
+        for key in [k for k, (cached, _) in cache.items() if cached is webelement]:
+            del cache[key]
 
 
 def extend_webelement(web_element) -> ExtendedRemoteWebElement:
     """Extend the selenium WebElement using the ExtendedRemoteWebElement"""
-    web_element.__class__ = ExtendedRemoteWebElement
+    if type(web_element) is not ExtendedRemoteWebElement:
+        web_element.__class__ = ExtendedRemoteWebElement
     return web_element
 
 
-HIGHLIGHT_ELEMENT_SCRIPT = """
+def _extend_found_webelement(web_element, selector_type, selector_value, element_name):
+    """Extend a web element and store the selector used to find it"""
+    web_element.selector_type = selector_type
+    web_element.selector_value = selector_value
+    web_element.name = element_name
+    if type(web_element) is not ExtendedRemoteWebElement:
+        web_element.__class__ = ExtendedRemoteWebElement
+    return web_element
+
+
+# Returns the type and checked state of an input element, or null for
+# any other element, in a single round-trip
+CHECKABLE_STATE_SCRIPT = (
+    "var e = arguments[0];"
+    "if (e.tagName.toLowerCase() !== 'input') { return null; }"
+    "return {type: e.type, checked: e.checked};"
+)
+
+# Returns the requested attributes and properties of an element
+SNAPSHOT_SCRIPT = (
+    "var e = arguments[0], snapshot = {attributes: {}, properties: {}};"
+    "arguments[1].forEach(a => snapshot.attributes[a] = e.getAttribute(a));"
+    "arguments[2].forEach(p => snapshot.properties[p] = e[p]);"
+    "return snapshot;"
+)
+
+# Returns an attribute of all the elements that match a selector
+FIND_ALL_ATTRIBUTE_SCRIPT = (
+    "var type = arguments[0], value = arguments[1], attribute = arguments[3];"
+    "var root = arguments[2] || document, nodes = [];"
+    "if (type === 'xpath') {"
+    "  var result = document.evaluate(value, root, null,"
+    "    XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);"
+    "  for (var i = 0; i < result.snapshotLength; i++) {"
+    "    nodes.push(result.snapshotItem(i));"
+    "  }"
+    "} else {"
+    "  if (type === 'id') { value = '[id=\"' + CSS.escape(value) + '\"]'; }"
+    "  else if (type === 'name') { value = '[name=\"' + CSS.escape(value) + '\"]'; }"
+    "  nodes = Array.from(root.querySelectorAll(value));"
+    "}"
+    "return nodes.map(node => node.getAttribute(attribute));"
+)
+
+# Returns an attribute of each of the given elements
+ELEMENTS_ATTRIBUTE_SCRIPT = "return arguments[0].map(e => e.getAttribute(arguments[1]));"
+
+
+_HIGHLIGHT_ELEMENT_SRC = """
     let boundingRect = arguments[0].getBoundingClientRect();
     boundingRect.left = boundingRect.left + window.scrollX;
     boundingRect.top = boundingRect.top + window.scrollY;
@@ -537,7 +696,7 @@ HIGHLIGHT_ELEMENT_SCRIPT = """
         left: document.createElement('div'),
         right: document.createElement('div'),
         bottom: document.createElement('div'),
-    }
+    };
 
     Object.keys(borders).forEach(border => {
         borders[border].style.position = 'absolute';
@@ -580,3 +739,7 @@ HIGHLIGHT_ELEMENT_SCRIPT = """
     setTimeout(() => {
         Object.keys(borders).forEach(border => borders[border].remove());
     }, 900);"""
+
+# The script is sent to the browser on every highlight, send it without
+# indentation. Newlines are kept so statements never run together
+HIGHLIGHT_ELEMENT_SCRIPT = re.sub(r'\n\s+', '\n', _HIGHLIGHT_ELEMENT_SRC).strip()
@@ -1,3 +1,6 @@
+import os
+from types import SimpleNamespace
+
 import pytest
 
 from golem.gui import gui_utils
@@ -49,3 +52,203 @@ class TestGetBrowser:
                 browser.open_browser()
                 expected = f'No executable file found using path {setting_path}'
                 assert expected in str(excinfo.value)
+
+
+class FakeSwitchTo:
+
+    def __init__(self, driver):
+        self.driver = driver
+
+    def window(self, window):
+        self.driver.current_window = window
+
+    def default_content(self):
+        self.driver.current_frame = None
+
+
+class FakeDriver:
+
+    def __init__(self):
+        self.closed = False
+        self.window_handles = ['window-1']
+        self.current_window = 'window-1'
+        self.current_frame = None
+        self.switch_to = FakeSwitchTo(self)
+
+    def quit(self):
+        self.closed = True
+
+    def close(self):
+        self.window_handles.remove(self.current_window)
+
+    def delete_all_cookies(self):
+        if self.closed:
+            raise Exception('driver is closed')
+
+    def execute_script(self, script):
+        pass
+
+    def get(self, url):
+        pass
+
+
+class TestOpenBrowser:
+
+    def test_max_open_browsers(self, monkeypatch, caplog):
+        monkeypatch.setitem(browser._BROWSER_FACTORIES, 'fake',
+                            lambda settings, remote_url: FakeDriver())
+        execution.settings = settings_manager.assign_settings_default_values({})
+        execution.settings['start_maximized'] = False
+        execution.settings['max_open_browsers'] = 2
+        execution.logger = test_logger.get_logger()
+        execution.browser_definition = {'name': 'fake', 'capabilities': {}}
+        execution.browsers = {}
+        execution._browsers_opened = 0
+        first = browser.open_browser()
+        second = browser.open_browser()
+        third = browser.open_browser()
+        assert first.closed
+        assert not second.closed and not third.closed
+        assert list(execution.browsers) == ['browser1', 'browser2']
+        assert execution.browser is third
+        warnings = [r for r in caplog.records if r.levelname == 'WARNING']
+        assert len(warnings) == 1
+        assert warnings[0].message == "Closing browser 'main', max_open_browsers (2) reached"
+        # browser ids are not reused after a browser is closed
+        browser.open_browser()
+        assert list(execution.browsers) == ['browser2', 'browser3']
+
+    def test_max_open_browsers_no_limit_by_default(self, monkeypatch):
+        monkeypatch.setitem(browser._BROWSER_FACTORIES, 'fake',
+                            lambda settings, remote_url: FakeDriver())
+        execution.settings = settings_manager.assign_settings_default_values({})
+        execution.settings['start_maximized'] = False
+        execution.logger = test_logger.get_logger()
+        execution.browser_definition = {'name': 'fake', 'capabilities': {}}
+        execution.browsers = {}
+        execution._browsers_opened = 0
+        drivers = [browser.open_browser() for _ in range(10)]
+        assert not any(driver.closed for driver in drivers)
+        assert len(execution.browsers) == 10
+
+    def test_reuse_browser_session(self, monkeypatch):
+        monkeypatch.setitem(browser._BROWSER_FACTORIES, 'fake',
+                            lambda settings, remote_url: FakeDriver())
+        monkeypatch.setitem(browser._BROWSER_FACTORIES, 'other-fake',
+                            lambda settings, remote_url: FakeDriver())
+        execution.settings = settings_manager.assign_settings_default_values({})
+        execution.settings['start_maximized'] = False
+        execution.settings['reuse_browser_session'] = True
+        execution.logger = test_logger.get_logger()
+        execution.browser_definition = {'name': 'fake', 'capabilities': {}}
+        execution.browser = None
+        execution.browsers = {}
+        execution._browsers_opened = 0
+        first = browser.get_browser()
+        assert browser.is_reused_browser(first)
+        # next test
+        execution.browser = None
+        execution.browsers = {}
+        execution._browsers_opened = 0
+        assert browser.get_browser() is first
+        assert execution.browsers == {'main': first}
+        # windows, frames and cached elements of the previous test are reset
+        first.window_handles.append('window-2')
+        first.current_window = 'window-2'
+        first.current_frame = 'frame'
+        first._selector_cache = {('css', 'div', False): None}
+        execution.browser = None
+        execution.browsers = {}
+        execution._browsers_opened = 0
+        assert browser.get_browser() is first
+        assert first.window_handles == ['window-1']
+        assert first.current_window == 'window-1'
+        assert first.current_frame is None
+        assert first._selector_cache == {}
+        # a browser that was closed is replaced
+        first.quit()
+        execution.browser = None
+        execution.browsers = {}
+        execution._browsers_opened = 0
+        second = browser.get_browser()
+        assert second is not first
+        assert browser.is_reused_browser(second)
+        # a test that runs with another browser does not reuse it
+        execution.browser_definition = {'name': 'other-fake', 'capabilities': {}}
+        execution.browser = None
+        execution.browsers = {}
+        execution._browsers_opened = 0
+        third = browser.get_browser()
+        assert third is not second
+        assert second.closed
+        assert browser.is_reused_browser(third)
+        browser.quit_reused_browser()
+        assert third.closed
+        assert not browser.is_reused_browser(third)
+
+
+class FakePoolManager:
+    """A urllib3 PoolManager that records its pool changes"""
+
+    def __init__(self):
+        self.connection_pool_kw = {}
+        self.cleared = False
+
+    def clear(self):
+        self.cleared = True
+
+
+class TestSetConnectionPoolSize:
+
+    def test_set_connection_pool_size(self):
+        pool_manager = FakePoolManager()
+        command_executor = SimpleNamespace(_conn=pool_manager)
+        driver = SimpleNamespace(command_executor=command_executor)
+        browser._set_connection_pool_size(driver, 10)
+        assert pool_manager.connection_pool_kw == {'maxsize': 10}
+        assert pool_manager.cleared
+
+    def test_set_connection_pool_size_zero(self):
+        pool_manager = FakePoolManager()
+        command_executor = SimpleNamespace(_conn=pool_manager)
+        driver = SimpleNamespace(command_executor=command_executor)
+        browser._set_connection_pool_size(driver, 0)
+        assert pool_manager.connection_pool_kw == {}
+        assert not pool_manager.cleared
+
+    def test_set_connection_pool_size_no_connection_manager(self):
+        driver = SimpleNamespace(command_executor=SimpleNamespace())
+        browser._set_connection_pool_size(driver, 10)
+
+
+class TestMatchExecutablePath:
+
+    def test_match_executable_path_is_cached(self, dir_function):
+        os.mkdir('drivers')
+        open(os.path.join('drivers', 'chromedriver_2.40'), 'w').close()
+        path = './drivers/chromedriver*'
+        matched = browser._match_executable_path(path, dir_function.path)
+        assert matched == os.path.join(dir_function.path, 'drivers', 'chromedriver_2.40')
+        # a newer executable is not picked up once the path is cached
+        open(os.path.join('drivers', 'chromedriver_2.41'), 'w').close()
+        assert browser._match_executable_path(path, dir_function.path) == matched
+
+    def test_match_executable_path_not_found_is_not_cached(self, dir_function):
+        os.mkdir('drivers')
+        path = './drivers/chromedriver*'
+        assert browser._match_executable_path(path, dir_function.path) is None
+        open(os.path.join('drivers', 'chromedriver_2.40'), 'w').close()
+        matched = browser._match_executable_path(path, dir_function.path)
+        assert matched == os.path.join(dir_function.path, 'drivers', 'chromedriver_2.40')
+
+    def test_resolve_executable_paths(self, dir_function):
+        os.mkdir('drivers')
+        open(os.path.join('drivers', 'chromedriver_2.40'), 'w').close()
+        settings = settings_manager.assign_settings_default_values({})
+        settings['chromedriver_path'] = './drivers/chromedriver*'
+        settings['geckodriver_path'] = './drivers/geckodriver*'
+        browser.resolve_executable_paths(settings, dir_function.path)
+        expected = os.path.join(dir_function.path, 'drivers', 'chromedriver_2.40')
+        key = ('./drivers/chromedriver*', dir_function.path)
+        assert browser._executable_path_cache[key] == expected
+        assert ('./drivers/geckodriver*', dir_function.path) not in browser._executable_path_cache
@@ -5,6 +5,8 @@ from golem.core import settings_manager
 
 DEFAULT_EMPTY = {
     'search_timeout': 0,
+    'search_poll_frequency': 0.2,
+    'selector_cache_ttl': 0,
     'wait_displayed': False,
     'screenshot_on_error': True,
     'screenshot_on_step': False,
@@ -24,6 +26,9 @@ DEFAULT_EMPTY = {
     'cli_log_level': 'INFO',
     'log_all_events': True,
     'start_maximized': True,
+    'max_open_browsers': 0,
+    'webdriver_pool_size': 10,
+    'reuse_browser_session': False,
     'screenshots': {}
 }
 
@@ -36,6 +41,8 @@ DEFAULT_PREDEFINED = {
     'iedriver_path': './drivers/iedriver*',
     'operadriver_path': './drivers/operadriver*',
     'search_timeout': 20,
+    'search_poll_frequency': 0.2,
+    'selector_cache_ttl': 0,
     'wait_displayed': False,
     'highlight_elements': False,
     'log_all_events': True,
@@ -48,6 +55,9 @@ DEFAULT_PREDEFINED = {
     'implicit_page_import': True,
     'wait_hook': None,
     'start_maximized': True,
+    'max_open_browsers': 0,
+    'webdriver_pool_size': 10,
+    'reuse_browser_session': False,
     'screenshots': {}
 }
 
@@ -20,41 +20,61 @@ def _define_browsers_mock(selected_browsers):
     return execution_runner.define_browsers(selected_browsers, [], default_browsers, [])
 
 
+# The tests in this module run with chrome, the definition never changes
+CHROME_BROWSER = _define_browsers_mock(['chrome'])[0]
+
+
 def _mock_report_directory(project, execution_name, timestamp):
     return execution_report.create_execution_directory(project, execution_name, timestamp)
 
 
+def _messages(records):
+    """The messages of a list of log records"""
+    return [record.message for record in records]
+
+
 def _read_report_json(execdir, test_name, set_name=''):
     path = test_report.test_file_report_dir(test_name, execdir=execdir, set_name=set_name)
     path = os.path.join(path, 'report.json')
-    with open(path) as f:
-        return json.load(f)
+    # read the whole file and decode it in one go
+    with open(path, 'rb') as f:
+        return json.loads(f.read())
+
+
+@pytest.fixture(scope="module")
+def runfix_settings(project_module):
+    """The project settings required to run a test.
+    These don't change between tests so they are read once per module.
+    """
+    _, project = project_module.activate()
+    return settings_manager.get_project_settings(project)
 
 
 @pytest.fixture(scope="function")
-def runfix(project_module, test_utils):
+def runfix(project_module, runfix_settings, test_utils, caplog):
     """A fixture that
       Uses a project fix with module scope,
       Creates a random test
       Creates a report directory for a future execution
-      Gets the settings and browser values required to run test
+      Uses the runfix_settings settings and the chrome browser
       Can run the test provided the test code
       Can read the json report
+      Can run the test and return its log records and json report
+
+    Each test gets its own test file: rewriting the same file within
+    the same second could make Python load its stale cached bytecode.
     """
     testdir, project = project_module.activate()
     test_name = test_utils.create_random_test(project)
     timestamp = utils.get_timestamp()
     exec_dir = _mock_report_directory(project, execution_name=test_name,
                                       timestamp=timestamp)
-    settings = settings_manager.get_project_settings(project)
-    browser = _define_browsers_mock(['chrome'])[0]
+    settings = runfix_settings
+    browser = CHROME_BROWSER
     env_name = None
 
-    def set_content(test_content):
-        test_module.edit_test_code(project, test_name, test_content)
-
     def run_test(code, test_data={}, secrets={}, from_suite=False, set_name=''):
-        set_content(code)
+        test_module.edit_test_code(project, test_name, code)
         test_runner.run_test(testdir, project, test_name, test_data, secrets, browser,
                              env_name, settings, exec_dir, set_name=set_name,
                              test_functions=[], from_suite=from_suite)
@@ -62,10 +82,15 @@ def runfix(project_module, test_utils):
     def read_report(set_name=''):
         return _read_report_json(exec_dir, test_name, set_name=set_name)
 
+    def execute(code, test_data={}, secrets={}, from_suite=False, set_name=''):
+        """Run the test and return the log records and the json report"""
+        run_test(code, test_data, secrets, from_suite, set_name)
+        return caplog.records, read_report(set_name)
+
     fix = SimpleNamespace(testdir=testdir, project=project, test_name=test_name,
                           report_directory=exec_dir, settings=settings,
-                          browser=browser, set_content=set_content,
-                          run_test=run_test, read_report=read_report)
+                          browser=browser, run_test=run_test,
+                          read_report=read_report, execute=execute)
     return fix
 
 
@@ -87,15 +112,15 @@ description = 'some description'
 def test(data)
 step('this step wont be run')
 """
-        runfix.run_test(code)
-        r = caplog.records
-        assert r[0].message == f'Test execution started: {runfix.test_name}'
-        assert r[1].message == 'Browser: chrome'
-        assert r[2].levelname == 'ERROR'
+        records, report = runfix.execute(code)
+        assert _messages(records)[:2] == [
+            f'Test execution started: {runfix.test_name}',
+            'Browser: chrome',
+        ]
+        assert records[2].levelname == 'ERROR'
         error_contains = 'def test(data)'
         error_contains_ver2 = "SyntaxError: expected ':'"
-        assert error_contains in r[2].message and error_contains_ver2 in r[2].message
-        report = runfix.read_report()
+        assert error_contains in records[2].message and error_contains_ver2 in records[2].message
         assert len(report) == 1
         report = report[0]
         assert report['test_file'] == runfix.test_name
@@ -136,16 +161,16 @@ def test(data):
 def after_Test(data):
     step('this step wont be run')
 """
-        runfix.run_test(code)
-        r = caplog.records
-        assert r[0].message == f'Test execution started: {runfix.test_name}'
-        assert r[1].message == 'Browser: chrome'
-        assert r[2].levelname == 'ERROR'
+        records, r = runfix.execute(code)
+        assert _messages(records)[:2] == [
+            f'Test execution started: {runfix.test_name}',
+            'Browser: chrome',
+        ]
+        assert records[2].levelname == 'ERROR'
         error_contains_one = "SyntaxError: \'(\' was never closed\n"
         error_contains_two = "element1 = (\'id\', \'someId\'\n"
-        assert error_contains_one in r[2].message and \
-               error_contains_two in r[2].message
-        r = runfix.read_report()
+        assert error_contains_one in records[2].message and \
+               error_contains_two in records[2].message
         assert len(r) == 1
         r = r[0]
         assert r['test_file'] == runfix.test_name
@@ -179,16 +204,16 @@ def test_one(data):
 def after_test(data):
     step('after_test step')
 """
-        runfix.run_test(code)
-        r = caplog.records
-        assert r[0].message == f'Test execution started: {runfix.test_name}'
-        assert r[1].message == 'Browser: chrome'
-        assert r[2].message == 'before_test step'
-        assert r[3].message == 'Test started: test_one'
-        assert r[4].message == 'test step'
-        assert r[5].message == SUCCESS_MESSAGE
-        assert r[6].message == 'after_test step'
-        r = runfix.read_report()
+        records, r = runfix.execute(code)
+        assert _messages(records)[:7] == [
+            f'Test execution started: {runfix.test_name}',
+            'Browser: chrome',
+            'before_test step',
+            'Test started: test_one',
+            'test step',
+            SUCCESS_MESSAGE,
+            'after_test step',
+        ]
         assert len(r) == 1
         r = r[0]
         assert r['test_file'] == runfix.test_name
@@ -224,19 +249,19 @@ def test_two(data):
 def after_test(data):
     step('after_test step')
 """
-        runfix.run_test(code)
-        r = caplog.records
-        assert r[0].message == f'Test execution started: {runfix.test_name}'
-        assert r[1].message == 'Browser: chrome'
-        assert r[2].message == 'before_test step'
-        assert r[3].message == 'Test started: test_one'
-        assert r[4].message == 'test one step'
-        assert r[5].message == SUCCESS_MESSAGE
-        assert r[6].message == 'Test started: test_two'
-        assert r[7].message == 'test two step'
-        assert r[8].message == SUCCESS_MESSAGE
-        assert r[9].message == 'after_test step'
-        r = runfix.read_report()
+        records, r = runfix.execute(code)
+        assert _messages(records)[:10] == [
+            f'Test execution started: {runfix.test_name}',
+            'Browser: chrome',
+            'before_test step',
+            'Test started: test_one',
+            'test one step',
+            SUCCESS_MESSAGE,
+            'Test started: test_two',
+            'test two step',
+            SUCCESS_MESSAGE,
+            'after_test step',
+        ]
         assert len(r) == 2
         assert r[0]['test_file'] == runfix.test_name
         assert r[0]['test'] == 'test_one'
@@ -268,19 +293,18 @@ def test_two(data):
 def after_test(data):
     step('after_test step')
 """
-        runfix.run_test(code)
-        r = caplog.records
-        assert r[0].message == f'Test execution started: {runfix.test_name}'
-        assert r[1].message == 'Browser: chrome'
-        assert r[2].message == 'before_test step'
-        assert r[3].message == 'Test started: test_one'
-        assert r[4].message == 'test one step'
-        assert r[5].message == SUCCESS_MESSAGE or r[5].message == FAILURE_MESSAGE
-        assert r[6].message == 'Test started: test_two'
-        assert 'AssertionError' in r[7].message
-        assert r[8].message == FAILURE_MESSAGE or r[5].message == SUCCESS_MESSAGE
-        assert r[9].message == 'after_test step'
-        r = runfix.read_report()
+        records, r = runfix.execute(code)
+        assert _messages(records)[:7] == [
+            f'Test execution started: {runfix.test_name}',
+            'Browser: chrome',
+            'before_test step',
+            'Test started: test_one',
+            'test one step',
+            SUCCESS_MESSAGE,
+            'Test started: test_two',
+        ]
+        assert 'AssertionError' in records[7].message
+        assert _messages(records)[8:10] == [FAILURE_MESSAGE, 'after_test step']
         assert len(r) == 2
         assert r[0]['test_file'] == runfix.test_name
         assert r[0]['test'] == 'test_one'
@@ -313,19 +337,23 @@ def test_two(data):
 def after_test(data):
     step('after_test step')
 """
-        runfix.run_test(code)
-        r = caplog.records
-        assert r[0].message == f'Test execution started: {runfix.test_name}'
-        assert r[1].message == 'Browser: chrome'
-        assert r[2].message == 'before_test step'
-        assert r[3].message == 'Test started: test_one'
-        assert 'AssertionError' in r[4].message
-        assert r[5].message == FAILURE_MESSAGE
-        assert r[6].message == 'Test started: test_two'
-        assert 'AssertionError' in r[7].message
-        assert r[8].message == FAILURE_MESSAGE
-        assert r[9].message == 'after_test step'
-        r = runfix.read_report()
+        records, r = runfix.execute(code)
+        assert _messages(records)[:4] == [
+            f'Test execution started: {runfix.test_name}',
+            'Browser: chrome',
+            'before_test step',
+            'Test started: test_one',
+        ]
+        assert 'AssertionError' in records[4].message
+        assert _messages(records)[5:7] == [
+            FAILURE_MESSAGE,
+            'Test started: test_two',
+        ]
+        assert 'AssertionError' in records[7].message
+        assert _messages(records)[8:10] == [
+            FAILURE_MESSAGE,
+            'after_test step',
+        ]
         assert len(r) == 2
         assert r[0]['test_file'] == r[1]['test_file'] == runfix.test_name
         assert r[0]['result'] == r[1]['result'] == ResultsEnum.FAILURE
@@ -379,17 +407,17 @@ def after_test(data):
             'password': 'password1'
         }
         secrets = dict(very='secret')
-        runfix.run_test(code, test_data=test_data, secrets=secrets)
-        r = caplog.records
-        assert r[0].message == f'Test execution started: {runfix.test_name}'
-        assert r[1].message == 'Browser: chrome'
-        assert r[2].message == 'Using data:\n    username: username1\n    password: password1'
-        assert r[3].message == 'before_test step'
-        assert r[4].message == 'Test started: test_name'
-        assert r[5].message == 'test step'
-        assert r[6].message == SUCCESS_MESSAGE
-        assert r[7].message == 'after_test step'
-        r = runfix.read_report()
+        records, r = runfix.execute(code, test_data=test_data, secrets=secrets)
+        assert _messages(records)[:8] == [
+            f'Test execution started: {runfix.test_name}',
+            'Browser: chrome',
+            'Using data:\n    username: username1\n    password: password1',
+            'before_test step',
+            'Test started: test_name',
+            'test step',
+            SUCCESS_MESSAGE,
+            'after_test step',
+        ]
         assert len(r) == 1
         r = r[0]
         assert r['test_file'] == runfix.test_name
@@ -425,15 +453,15 @@ def test_one(data):
 def after_test(data):
     step('after_test step')
 """
-        runfix.run_test(code)
-        r = caplog.records
-        assert r[0].message == f'Test execution started: {runfix.test_name}'
-        assert r[1].message == 'Browser: chrome'
-        assert r[2].levelname == 'ERROR'
-        assert 'before_test step fail' in r[2].message
-        assert 'AssertionError: before_test step fail' in r[2].message
-        assert r[3].message == 'after_test step'
-        r = runfix.read_report()
+        records, r = runfix.execute(code)
+        assert _messages(records)[:2] == [
+            f'Test execution started: {runfix.test_name}',
+            'Browser: chrome',
+        ]
+        assert records[2].levelname == 'ERROR'
+        assert 'before_test step fail' in records[2].message
+        assert 'AssertionError: before_test step fail' in records[2].message
+        assert records[3].message == 'after_test step'
         assert len(r) == 1
         r = r[0]
         assert r['test_file'] == runfix.test_name
@@ -463,8 +491,7 @@ def test_one(data):
 def after_test(data):
     step('after_test step')
 """
-        runfix.run_test(code)
-        r = runfix.read_report()
+        _, r = runfix.execute(code)
         r = r[0]
         assert len(r['errors']) == 2
         assert r['result'] == ResultsEnum.FAILURE
@@ -490,12 +517,12 @@ def after_test(data):
     step('after_test step')
     error('error in after_test')
 """
-        runfix.run_test(code)
-        r = caplog.records
-        assert 'AssertionError: before_test step fail' in r[2].message
-        assert r[3].message == 'after_test step'
-        assert r[4].message == 'error in after_test'
-        r = runfix.read_report()
+        records, r = runfix.execute(code)
+        assert 'AssertionError: before_test step fail' in records[2].message
+        assert _messages(records)[3:5] == [
+            'after_test step',
+            'error in after_test',
+        ]
         assert len(r) == 2
         assert r[0]['test'] == 'before_test'
         assert len(r[0]['errors']) == 1
@@ -526,12 +553,10 @@ def after_test(data):
     step('after_test step')
     foo = bar
 """
-        runfix.run_test(code)
-        r = caplog.records
-        assert 'AssertionError: before_test step fail' in r[2].message
-        assert r[3].message == 'after_test step'
-        assert "NameError: name 'bar' is not defined" in r[4].message
-        r = runfix.read_report()
+        records, r = runfix.execute(code)
+        assert 'AssertionError: before_test step fail' in records[2].message
+        assert records[3].message == 'after_test step'
+        assert "NameError: name 'bar' is not defined" in records[4].message
         assert len(r) == 2
         assert r[0]['test'] == 'before_test'
         assert r[0]['result'] == ResultsEnum.FAILURE
@@ -563,11 +588,9 @@ def test(data):
 def after_test(data):
     fail('failure in after_test')
 """
-        runfix.run_test(code)
-        r = caplog.records
-        assert 'before_test step fail' in r[2].message
-        assert 'AssertionError: failure in after_test' in r[3].message
-        r = runfix.read_report()
+        records, r = runfix.execute(code)
+        assert 'before_test step fail' in records[2].message
+        assert 'AssertionError: failure in after_test' in records[3].message
         assert len(r) == 2
         assert r[0]['test'] == 'before_test'
         assert r[0]['result'] == ResultsEnum.FAILURE
@@ -783,14 +806,16 @@ def test(data):
 def after_test(data):
     step('after_test step')
 """
-        runfix.run_test(code)
-        r = caplog.records
-        assert r[3].message == 'Test started: test'
-        assert r[4].message == 'test step'
-        assert 'AssertionError: test fail' in r[5].message
-        assert r[6].message == FAILURE_MESSAGE
-        assert r[7].message == 'after_test step'
-        report = runfix.read_report()
+        records, report = runfix.execute(code)
+        assert _messages(records)[3:5] == [
+            'Test started: test',
+            'test step',
+        ]
+        assert 'AssertionError: test fail' in records[5].message
+        assert _messages(records)[6:8] == [
+            FAILURE_MESSAGE,
+            'after_test step',
+        ]
         assert len(report) == 1
         r = report[0]
         assert r['result'] == ResultsEnum.FAILURE
@@ -841,14 +866,14 @@ def test_one(data):
 def after_test(data):
     foo = bar
 """
-        runfix.run_test(code)
-        r = caplog.records
-        assert r[2].message == 'before_test step'
-        assert r[3].message == 'Test started: test_one'
-        assert 'AssertionError: test fail' in r[4].message
-        assert r[5].message == FAILURE_MESSAGE
-        assert "NameError: name 'bar' is not defined" in r[6].message
-        r = runfix.read_report()
+        records, r = runfix.execute(code)
+        assert _messages(records)[2:4] == [
+            'before_test step',
+            'Test started: test_one',
+        ]
+        assert 'AssertionError: test fail' in records[4].message
+        assert records[5].message == FAILURE_MESSAGE
+        assert "NameError: name 'bar' is not defined" in records[6].message
         assert len(r) == 2
         assert r[0]['test'] == 'test_one'
         assert r[0]['result'] == ResultsEnum.FAILURE
@@ -924,12 +949,10 @@ def test(data):
 def after_test(data):
     step('after_test step')
 """
-        runfix.run_test(code)
-        r = caplog.records
-        assert r[4].message == 'error in test'
-        assert "NameError: name 'bar' is not defined" in r[5].message
-        assert r[6].message == CODE_ERROR_MESSAGE
-        r = runfix.read_report()
+        records, r = runfix.execute(code)
+        assert records[4].message == 'error in test'
+        assert "NameError: name 'bar' is not defined" in records[5].message
+        assert records[6].message == CODE_ERROR_MESSAGE
         r = r[0]
         assert r['result'] == ResultsEnum.CODE_ERROR
         assert len(r['steps']) == 2
@@ -1015,10 +1038,8 @@ def after_test(data):
                 '    step("test")\n'
                 'def after_test(data):\n'
                 '    step("after_test")')
-        runfix.run_test(code, from_suite=True)
-        records = caplog.records
+        records, report = runfix.execute(code, from_suite=True)
         assert records[2].message == 'Test skipped: test'
-        report = runfix.read_report()
         assert len(report) == 1
         assert report[0]['result'] == ResultsEnum.SKIPPED
     #
@@ -1050,15 +1071,15 @@ def setup(data):
 def test_one(data):
     step('test step')
 """
-        runfix.run_test(code)
-        r = caplog.records
-        assert r[0].message == f'Test execution started: {runfix.test_name}'
-        assert r[1].message == 'Browser: chrome'
-        assert r[2].levelname == 'INFO'
-        assert r[2].message == 'setup hook function is deprecated, use before_test'
-        assert r[3].levelname == 'ERROR'
-        assert 'setup step fail' in r[3].message
-        r = runfix.read_report()
+        records, r = runfix.execute(code)
+        assert _messages(records)[:2] == [
+            f'Test execution started: {runfix.test_name}',
+            'Browser: chrome',
+        ]
+        assert records[2].levelname == 'INFO'
+        assert records[2].message == 'setup hook function is deprecated, use before_test'
+        assert records[3].levelname == 'ERROR'
+        assert 'setup step fail' in records[3].message
         assert len(r) == 1
         r = r[0]
         assert r['test_file'] == runfix.test_name
@@ -1078,11 +1099,9 @@ def test_one(data):
 def teardown(data):
     fail('teardown fail')
 """
-        runfix.run_test(code)
-        r = caplog.records
-        assert r[5].message == 'teardown hook function is deprecated, use after_test'
-        assert 'AssertionError: teardown fail' in r[6].message
-        r = runfix.read_report()
+        records, r = runfix.execute(code)
+        assert records[5].message == 'teardown hook function is deprecated, use after_test'
+        assert 'AssertionError: teardown fail' in records[6].message
         assert len(r) == 2
         assert r[0]['test'] == 'test_one'
         assert r[0]['result'] == ResultsEnum.SUCCESS
@@ -1100,17 +1119,17 @@ def test_one(data):
 def test_two(data):
     step('test step')
 """
-        runfix.run_test(code)
-        r = caplog.records
-        assert r[2].message == 'before_each step'
-        assert r[3].message == 'Test started: test_one'
-        assert r[4].message == 'test step'
-        assert r[5].message == SUCCESS_MESSAGE
-        assert r[6].message == 'before_each step'
-        assert r[7].message == 'Test started: test_two'
-        assert r[8].message == 'test step'
-        assert r[9].message == SUCCESS_MESSAGE
-        r = runfix.read_report()
+        records, r = runfix.execute(code)
+        assert _messages(records)[2:10] == [
+            'before_each step',
+            'Test started: test_one',
+            'test step',
+            SUCCESS_MESSAGE,
+            'before_each step',
+            'Test started: test_two',
+            'test step',
+            SUCCESS_MESSAGE,
+        ]
         assert len(r) == 2
         assert r[0]['test'] == 'test_one'
         assert r[0]['result'] == ResultsEnum.SUCCESS
@@ -1128,17 +1147,17 @@ def test_one(data):
 def test_two(data):
     step('test step')
 """
-        runfix.run_test(code)
-        r = caplog.records
-        assert r[2].message == 'Test started: test_one'
-        assert r[3].message == 'test step'
-        assert r[4].message == SUCCESS_MESSAGE
-        assert r[5].message == 'after_each step'
-        assert r[6].message == 'Test started: test_two'
-        assert r[7].message == 'test step'
-        assert r[8].message == SUCCESS_MESSAGE
-        assert r[9].message == 'after_each step'
-        r = runfix.read_report()
+        records, r = runfix.execute(code)
+        assert _messages(records)[2:10] == [
+            'Test started: test_one',
+            'test step',
+            SUCCESS_MESSAGE,
+            'after_each step',
+            'Test started: test_two',
+            'test step',
+            SUCCESS_MESSAGE,
+            'after_each step',
+        ]
         assert len(r) == 2
         assert r[0]['test'] == 'test_one'
         assert r[0]['result'] == ResultsEnum.SUCCESS
@@ -1166,14 +1185,14 @@ def test_one(data):
 def test_two(data):
     step('test step')
 """
-        runfix.run_test(code)
-        r = caplog.records
-        assert r[2].message == 'before_each step'
-        assert 'AssertionError: before_each fail' in r[3].message
-        assert r[4].message == 'Test skipped: test_one'
-        assert r[5].message == 'Test skipped: test_two'
-        assert r[6].message == 'after_test step'
-        r = runfix.read_report()
+        records, r = runfix.execute(code)
+        assert records[2].message == 'before_each step'
+        assert 'AssertionError: before_each fail' in records[3].message
+        assert _messages(records)[4:7] == [
+            'Test skipped: test_one',
+            'Test skipped: test_two',
+            'after_test step',
+        ]
         assert len(r) == 3
         assert r[0]['test'] == 'before_each'
         assert r[0]['result'] == ResultsEnum.FAILURE
@@ -1199,16 +1218,18 @@ def test_one(data):
 def test_two(data):
     step('test step')
 """
-        runfix.run_test(code)
-        r = caplog.records
-        assert r[2].message == 'Test started: test_one'
-        assert r[3].message == 'test step'
-        assert r[4].message == SUCCESS_MESSAGE
-        assert r[5].message == 'after_each step'
-        assert 'AssertionError: after_each fail' in r[6].message
-        assert r[7].message == 'Test skipped: test_two'
-        assert r[8].message == 'after_test step'
-        r = runfix.read_report()
+        records, r = runfix.execute(code)
+        assert _messages(records)[2:6] == [
+            'Test started: test_one',
+            'test step',
+            SUCCESS_MESSAGE,
+            'after_each step',
+        ]
+        assert 'AssertionError: after_each fail' in records[6].message
+        assert _messages(records)[7:9] == [
+            'Test skipped: test_two',
+            'after_test step',
+        ]
         assert len(r) == 3
         assert r[0]['test'] == 'test_one'
         assert r[0]['result'] == ResultsEnum.SUCCESS
@@ -1220,6 +1241,14 @@ def test_two(data):
 
 class TestTestRunnerSetExecutionModuleValues:
 
+    # the public values of the golem.execution module
+    EXECUTION_ATTRS = frozenset({
+        'browser', 'browser_definition', 'browsers', 'data', 'secrets', 'description',
+        'settings', 'test_file', 'test_dirname', 'test_path', 'project_name',
+        'project_path', 'testdir', 'execution_reportdir', 'testfile_reportdir', 'logger',
+        'tags', 'environment', 'test_name', 'steps', 'errors', 'test_reportdir', 'timers'
+    })
+
     def test_set_execution_module_runner_values(self, project_module, test_utils):
         testdir, project = project_module.activate()
         test_file = test_utils.create_random_test(project)
@@ -1229,7 +1258,7 @@ class TestTestRunnerSetExecutionModuleValues:
         testfile_reportdir = test_report.test_file_report_dir(test_file, execdir=executiondir)
         assert testfile_reportdir
         settings = settings_manager.get_project_settings(project)
-        browser = _define_browsers_mock(['chrome'])[0]
+        browser = CHROME_BROWSER
         test_data = {}
         secrets = {}
         env_name = 'foo'
@@ -1238,8 +1267,8 @@ class TestTestRunnerSetExecutionModuleValues:
                                         set_name='')
         runner._set_execution_module_values()
         from golem import execution
-        attrs = [x for x in dir(execution) if not x.startswith('_')]
-        assert len(attrs) == 23
+        attrs = {x for x in vars(execution) if not x.startswith('_')}
+        assert attrs == self.EXECUTION_ATTRS
         assert execution.browser is None
         assert execution.browser_definition == browser
         assert execution.browsers == {}
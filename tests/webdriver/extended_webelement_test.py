@@ -0,0 +1,443 @@
+import shutil
+import subprocess
+import time
+
+import pytest
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.remote.webelement import WebElement as RemoteWebElement
+
+from golem import execution
+from golem.core.exceptions import (ElementNotFound, ElementNotDisplayed,
+                                   IncorrectSelectorType)
+from golem.test_runner import test_logger
+from golem.webdriver import extended_webelement
+from golem.webdriver.extended_driver import GolemExtendedDriver
+from golem.webdriver.extended_webelement import (Finder, ExtendedRemoteWebElement,
+                                                SNAPSHOT_SCRIPT, HIGHLIGHT_ELEMENT_SCRIPT,
+                                                extend_webelement)
+
+
+class FakeElement:
+
+    def __init__(self, displayed):
+        self.displayed = displayed
+
+    def is_displayed(self):
+        return self.displayed
+
+
+class StaleParent:
+    """A driver whose elements are no longer attached to the page"""
+
+    def execute(self, command, params=None):
+        raise StaleElementReferenceException('stale element')
+
+
+class FakeFinder(Finder):
+    """A Finder that finds an element after a number of attempts"""
+
+    def __init__(self, attempts_before_found=0, displayed=True):
+        self.attempts_before_found = attempts_before_found
+        self.displayed = displayed
+        self.attempts = 0
+        self.calls = []
+
+    def find_elements(self, by, value):
+        self.attempts += 1
+        self.calls.append((by, value))
+        if self.attempts <= self.attempts_before_found:
+            return []
+        return [FakeElement(self.displayed)]
+
+
+@pytest.fixture
+def execution_settings():
+    """Set the execution settings and logger used to find elements"""
+    execution.logger = test_logger.get_logger()
+    execution.settings = {'search_timeout': 0, 'search_poll_frequency': 0.05,
+                          'selector_cache_ttl': 0, 'wait_displayed': False,
+                          'highlight_elements': False}
+
+
+class TestFindWebelement:
+
+    def test_find_webelement(self, execution_settings):
+        finder = FakeFinder()
+        finder._find_webelement('id', 'foo', 'foo', timeout=0)
+        assert finder.calls == [('id', 'foo')]
+
+    def test_find_webelement_incorrect_selector_type(self, execution_settings):
+        finder = FakeFinder()
+        with pytest.raises(IncorrectSelectorType):
+            finder._find_webelement('invalid', 'foo', 'foo', timeout=5)
+        assert finder.calls == []
+
+    def test_find_webelement_timeout_zero(self, execution_settings):
+        finder = FakeFinder(attempts_before_found=1)
+        start = time.monotonic()
+        with pytest.raises(ElementNotFound):
+            finder._find_webelement('css', 'div', 'div', timeout=0)
+        assert finder.attempts == 1
+        assert time.monotonic() - start < 0.1
+
+    def test_find_webelement_retries(self, execution_settings):
+        finder = FakeFinder(attempts_before_found=3)
+        start = time.monotonic()
+        finder._find_webelement('css', 'div', 'div', timeout=5)
+        assert finder.attempts == 4
+        # retries are done every search_poll_frequency seconds
+        assert time.monotonic() - start < 1
+
+    def test_find_webelement_wait_displayed(self, execution_settings):
+        finder = FakeFinder()
+        webelement = finder._find_webelement('css', 'div', 'div', timeout=1, wait_displayed=True)
+        assert webelement.displayed
+
+    def test_find_webelement_not_displayed(self, execution_settings):
+        finder = FakeFinder(displayed=False)
+        with pytest.raises(ElementNotDisplayed):
+            finder._find_webelement('css', 'div', 'div', timeout=0.1, wait_displayed=True)
+
+    def test_find_webelement_not_displayed_single_search(self, execution_settings):
+        finder = FakeFinder(displayed=False)
+        with pytest.raises(ElementNotDisplayed):
+            finder._find_webelement('css', 'div', 'div', timeout=0, wait_displayed=True)
+        # presence is known from the last attempt, no extra search is made
+        assert len(finder.calls) == 1
+
+    def test_find_webelement_not_found_wait_displayed(self, execution_settings):
+        finder = FakeFinder(attempts_before_found=100)
+        with pytest.raises(ElementNotFound):
+            finder._find_webelement('css', 'div', 'div', timeout=0.1, wait_displayed=True)
+
+    def test_find_webelement_selector_cache_disabled(self, execution_settings):
+        finder = FakeFinder()
+        finder._find_webelement('css', 'div', 'div', timeout=1)
+        finder._find_webelement('css', 'div', 'div', timeout=1)
+        assert finder.attempts == 2
+
+    def test_find_webelement_selector_cache(self, execution_settings):
+        execution.settings['selector_cache_ttl'] = 5
+        finder = FakeFinder()
+        webelement = finder._find_webelement('css', 'div', 'div', timeout=1)
+        assert finder._find_webelement('css', 'div', 'div', timeout=1) is webelement
+        assert finder.attempts == 1
+        finder._find_webelement('css', 'span', 'span', timeout=1)
+        assert finder.attempts == 2
+
+    def test_find_webelement_selector_cache_expired(self, execution_settings):
+        execution.settings['selector_cache_ttl'] = 0.01
+        finder = FakeFinder()
+        finder._find_webelement('css', 'div', 'div', timeout=1)
+        time.sleep(0.02)
+        finder._find_webelement('css', 'div', 'div', timeout=1)
+        assert finder.attempts == 2
+
+    def test_find_webelement_selector_cache_prunes_expired(self, execution_settings):
+        execution.settings['selector_cache_ttl'] = 0.01
+        finder = FakeFinder()
+        finder._find_webelement('css', 'div', 'div', timeout=1)
+        finder._find_webelement('css', 'span', 'span', timeout=1)
+        time.sleep(0.02)
+        finder._find_webelement('css', 'a', 'a', timeout=1)
+        assert list(finder._selector_cache) == [('css', 'a', False)]
+
+    def test_find_webelement_selector_cache_max_size(self, execution_settings, monkeypatch):
+        monkeypatch.setattr(extended_webelement, '_SELECTOR_CACHE_MAX_SIZE', 2)
+        execution.settings['selector_cache_ttl'] = 5
+        finder = FakeFinder()
+        for selector in ('div', 'span', 'a'):
+            finder._find_webelement('css', selector, selector, timeout=1)
+        assert list(finder._selector_cache) == [('css', 'span', False), ('css', 'a', False)]
+
+    def test_find_webelement_selector_cache_single_attempt(self, execution_settings):
+        execution.settings['selector_cache_ttl'] = 5
+        finder = FakeFinder()
+        finder._find_webelement('css', 'div', 'div', timeout=1)
+        finder._find_webelement('css', 'div', 'div', timeout=0)
+        assert finder.attempts == 2
+
+    def test_find_webelement_selector_cache_not_displayed(self, execution_settings):
+        execution.settings['selector_cache_ttl'] = 5
+        finder = FakeFinder()
+        webelement = finder._find_webelement('css', 'div', 'div', timeout=1,
+                                             wait_displayed=True)
+        webelement.displayed = False
+        finder.displayed = True
+        assert finder._find_webelement('css', 'div', 'div', timeout=1,
+                                       wait_displayed=True) is not webelement
+        assert finder.attempts == 2
+
+    def test_find_webelement_selector_cache_stale(self, execution_settings):
+        execution.settings['selector_cache_ttl'] = 5
+        finder = FakeFinder()
+        finder._find_webelement('css', 'div', 'div', timeout=1)
+        webelement = ExtendedRemoteWebElement(parent=StaleParent(), id_='element-id')
+        finder._selector_cache[('css', 'div', False)] = (webelement, time.monotonic())
+        webelement._cached_in = finder._selector_cache
+        with pytest.raises(StaleElementReferenceException):
+            webelement.click()
+        assert finder._selector_cache == {}
+
+    def test_element_is_present_selector_cache(self, execution_settings):
+        execution.settings['selector_cache_ttl'] = 5
+        finder = FakeFinder()
+        assert GolemExtendedDriver.element_is_present(finder, 'div')
+        # the element is removed from the page
+        finder.attempts_before_found = 10
+        assert not GolemExtendedDriver.element_is_present(finder, 'div')
+
+
+class TestFind:
+
+    def test_find_extended_webelement_is_returned(self, execution_settings):
+        element = ExtendedRemoteWebElement(parent=None, id_='element-id')
+        assert FakeFinder().find(element) is element
+
+
+class TestFindAll:
+
+    @pytest.mark.parametrize('args,kwargs,expected', [
+        ((('id', 'foo'),), {}, ('id', 'foo')),
+        ((('link_text', 'foo', 'Foo link'),), {}, ('link text', 'foo')),
+        (('div > a',), {}, ('css selector', 'div > a')),
+        (('//div/a',), {}, ('xpath', '//div/a')),
+        ((), {'name': 'foo'}, ('name', 'foo')),
+        ((), {'partial_link_text': 'foo'}, ('partial link text', 'foo')),
+        ((), {'tag_name': 'input'}, ('tag name', 'input')),
+    ])
+    def test_find_all_selector(self, args, kwargs, expected):
+        finder = FakeFinder(attempts_before_found=1)
+        assert finder.find_all(*args, **kwargs) == []
+        assert finder.calls == [expected]
+
+    def test_find_all_incorrect_selector_type(self):
+        with pytest.raises(IncorrectSelectorType):
+            FakeFinder().find_all(('invalid', 'foo'))
+        with pytest.raises(IncorrectSelectorType):
+            FakeFinder().find_all()
+
+
+class TestStrIsXpathSelector:
+
+    @pytest.mark.parametrize('selector,expected', [
+        ('//div', True),
+        ('./div', True),
+        ('(//div)[1]', True),
+        ('../div', True),
+        ('*/div', True),
+        ('div > a', False),
+        ('#foo', False),
+    ])
+    def test_str_is_xpath_selector(self, selector, expected):
+        assert Finder._str_is_xpath_selector(selector) is expected
+
+
+class KeysElement(ExtendedRemoteWebElement):
+    """An element that records the keys sent to it"""
+
+    def __init__(self):
+        self.sent = []
+
+    def send_keys(self, *value):
+        self.sent.append(''.join(value))
+
+
+class TestSendKeysWithDelay:
+    def test_send_keys_with_delay(self):
+        element = KeysElement()
+        start = time.monotonic()
+        element.send_keys_with_delay('abc', delay=0.05)
+        elapsed = time.monotonic() - start
+        assert element.sent == ['a', 'b', 'c']
+        assert 0.1 <= elapsed < 0.5
+
+    def test_send_keys_with_delay_zero(self):
+        element = KeysElement()
+        element.send_keys_with_delay('abc', delay=0)
+        assert element.sent == ['abc']
+
+    def test_send_keys_with_delay_invalid_delay(self):
+        element = KeysElement()
+        with pytest.raises(ValueError):
+            element.send_keys_with_delay('abc', delay='1')
+        with pytest.raises(ValueError):
+            element.send_keys_with_delay('abc', delay=-1)
+
+
+class TestPressKey:
+
+    def test_press_key(self):
+        element = KeysElement()
+        element.press_key('ENTER')
+        assert element.sent == [Keys.ENTER]
+
+    def test_press_key_invalid_key(self):
+        element = KeysElement()
+        with pytest.raises(ValueError, match='Key FOO is invalid'):
+            element.press_key('FOO')
+        assert element.sent == []
+
+
+class CheckableElement(ExtendedRemoteWebElement):
+    """An element whose checkable state is returned by its parent"""
+
+    class Parent:
+
+        def __init__(self, state):
+            self.state = state
+            self.scripts = 0
+
+        def execute_script(self, script, *args):
+            self.scripts += 1
+            return self.state
+
+    def __init__(self, state):
+        self._parent = self.Parent(state)
+        self.name = 'element'
+        self.clicks = 0
+
+    def click(self):
+        self.clicks += 1
+
+
+class TestCheck:
+
+    @pytest.mark.parametrize('state,clicks', [
+        ({'type': 'checkbox', 'checked': False}, 1),
+        ({'type': 'checkbox', 'checked': True}, 0),
+        ({'type': 'radio', 'checked': False}, 1),
+    ])
+    def test_check(self, state, clicks):
+        element = CheckableElement(state)
+        element.check()
+        assert element.clicks == clicks
+        assert element.parent.scripts == 1
+
+    @pytest.mark.parametrize('state', [None, {'type': 'text', 'checked': False}])
+    def test_check_not_checkable(self, state):
+        with pytest.raises(ValueError, match='is not checkbox or radiobutton'):
+            CheckableElement(state).check()
+
+    @pytest.mark.parametrize('state,clicks', [
+        ({'type': 'checkbox', 'checked': True}, 1),
+        ({'type': 'checkbox', 'checked': False}, 0),
+    ])
+    def test_uncheck(self, state, clicks):
+        element = CheckableElement(state)
+        element.uncheck()
+        assert element.clicks == clicks
+
+    @pytest.mark.parametrize('state', [None, {'type': 'radio', 'checked': True}])
+    def test_uncheck_not_checkbox(self, state):
+        with pytest.raises(ValueError, match='is not checkbox'):
+            CheckableElement(state).uncheck()
+
+
+class TestSnapshot:
+
+    def test_snapshot(self):
+        snapshot = {'attributes': {'href': '/foo'}, 'properties': {'checked': True}}
+        element = CheckableElement(snapshot)
+        calls = []
+        element.parent.execute_script = lambda *args: calls.append(args) or snapshot
+        assert element.snapshot(('href',), ['checked']) == snapshot
+        assert calls == [(SNAPSHOT_SCRIPT, element, ['href'], ['checked'])]
+
+
+class TestExtendWebelement:
+
+    def test_extend_webelement(self):
+        element = RemoteWebElement(parent=None, id_='element-id')
+        extended = extend_webelement(element)
+        assert extended is element
+        assert type(extended) is ExtendedRemoteWebElement
+        assert extend_webelement(extended) is element
+
+
+class TestFindAllAttribute:
+
+    class ScriptFinder(FakeFinder):
+
+        def execute_script(self, script, *args):
+            self.calls.append(args)
+            return ['/foo']
+
+    @pytest.mark.parametrize('element,expected', [
+        ('ul > li > a', ('css', 'ul > li > a')),
+        ('//ul/li/a', ('xpath', '//ul/li/a')),
+        (('id', 'foo'), ('id', 'foo')),
+        (('tag_name', 'a', 'Links'), ('tag_name', 'a')),
+    ])
+    def test_find_all_attribute(self, element, expected):
+        finder = self.ScriptFinder()
+        assert finder.find_all_attribute(element, 'href') == ['/foo']
+        assert finder.calls == [expected + (None, 'href')]
+
+    @pytest.mark.parametrize('selector_type,by', [
+        ('link_text', 'link text'),
+        ('partial_link_text', 'partial link text'),
+    ])
+    def test_find_all_attribute_link_text(self, selector_type, by):
+        finder = self.ScriptFinder()
+        assert finder.find_all_attribute((selector_type, 'Foo'), 'href') == ['/foo']
+        # the attribute of the found elements is read with a single script
+        assert finder.calls[0] == (by, 'Foo')
+        webelements, attribute = finder.calls[1]
+        assert len(webelements) == 1
+        assert attribute == 'href'
+        assert len(finder.calls) == 2
+
+    def test_find_all_attribute_link_text_not_found(self):
+        finder = self.ScriptFinder(attempts_before_found=1)
+        assert finder.find_all_attribute(('link_text', 'Foo'), 'href') == []
+        assert finder.calls == [('link text', 'Foo')]
+
+    def test_find_all_attribute_incorrect_selector_type(self):
+        with pytest.raises(IncorrectSelectorType):
+            self.ScriptFinder().find_all_attribute(('invalid', 'foo'), 'href')
+
+
+class TestWait:
+
+    class WaitElement(ExtendedRemoteWebElement):
+
+        def __init__(self, enabled):
+            self._parent = None
+            self.name = 'element'
+            self.enabled = enabled
+
+        def is_enabled(self):
+            return self.enabled
+
+    def test_wait_enabled(self):
+        element = self.WaitElement(enabled=True)
+        assert element.wait_enabled(timeout=0) is element
+
+    def test_wait_enabled_timeout(self):
+        element = self.WaitElement(enabled=False)
+        with pytest.raises(TimeoutException, match='element element to be enabled'):
+            element.wait_enabled(timeout=0)
+
+    def test_wait_not_enabled(self):
+        element = self.WaitElement(enabled=False)
+        assert element.wait_not_enabled(timeout=0) is element
+        with pytest.raises(TimeoutException, match='to be not enabled'):
+            self.WaitElement(enabled=True).wait_not_enabled(timeout=0)
+
+
+class TestHighlightElementScript:
+
+    def test_highlight_element_script_is_minified(self):
+        lines = HIGHLIGHT_ELEMENT_SCRIPT.splitlines()
+        assert all(line == line.lstrip() for line in lines)
+        # statements are kept apart by newlines
+        assert "};\nObject.keys(borders)" in HIGHLIGHT_ELEMENT_SCRIPT
+
+    @pytest.mark.skipif(shutil.which('node') is None, reason='node is not installed')
+    def test_highlight_element_script_is_valid_javascript(self, tmp_path):
+        script_path = tmp_path / 'highlight.js'
+        script_path.write_text(f'function highlight() {{\n{HIGHLIGHT_ELEMENT_SCRIPT}\n}}')
+        result = subprocess.run(['node', '--check', str(script_path)])
+        assert result.returncode == 0